@@ -1,11 +1,11 @@
+import time
+_start_time = time.perf_counter()  # Für Startzeit-Budget
+
 import cv2
 import os
 import sys
-import time
-import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
 import json
-import shutil
+# tkinter und shutil werden erst im Klassen-Dialog geladen (schnellerer Start)
 
 # --- KONFIGURATION ---
 # Wichtig für PyInstaller: Pfad zur .exe verwenden, nicht zum temp-Ordner
@@ -17,9 +17,43 @@ else:
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
 base_dir = os.path.join(script_dir, 'trainingsdaten')
+roi_dir = os.path.join(script_dir, 'trainingsdaten_roi')  # Ausschnitte getrennt von ganzen Frames
 classes_file = os.path.join(script_dir, 'classes.json')
+USE_ROI = False  # Nur das erkannte Bauteil speichern (für ein auf Ausschnitten trainiertes Modell)
+EMPTY_CLASS = 'nichts'  # Leere Szene: immer ganze Frames speichern, ohne ROI
 # ---------------------
 
+# Gemeinsame Module (profiling.py, roi.py) liegen im Hauptordner.
+# PyInstaller sieht den Pfad nicht zur Laufzeit -> mit der Spec-Datei bauen:
+#   pyinstaller collector_pro.spec
+if not getattr(sys, 'frozen', False):
+    sys.path.insert(0, os.path.dirname(script_dir))
+try:
+    import profiling
+except ImportError:
+    # .exe ohne Spec-Datei gebaut: Profiling und Startzeit-Check deaktivieren
+    from contextlib import nullcontext
+
+    class _NoProfiling:
+        """Ersatz wenn profiling.py nicht mitgebaut wurde"""
+        enabled = False
+
+        def setup(self, name, out_dir):
+            if '--profile' in sys.argv or os.environ.get('TRAINER_PROFILE', '') not in ('', '0'):
+                print("WARNUNG: Profiling angefordert, aber profiling.py fehlt im Build "
+                      "(mit collector_pro.spec bauen)")
+            return False
+
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: nullcontext()
+
+    profiling = _NoProfiling()
+try:
+    import roi
+except ImportError:
+    roi = None  # .exe ohne --paths gebaut: ROI nicht verfügbar
+profiling.setup('collector', script_dir)
+
 def load_classes():
     """Lädt die Klassenliste aus der JSON-Datei"""
     if os.path.exists(classes_file):
@@ -36,9 +70,9 @@ def save_classes(classes):
     with open(classes_file, 'w', encoding='utf-8') as f:
         json.dump(classes, f, indent=2, ensure_ascii=False)
 
-def get_image_count(class_name):
+def get_image_count(class_name, data_dir=base_dir):
     """Zählt die Anzahl der Bilder im Ordner einer Klasse"""
-    class_dir = os.path.join(base_dir, class_name)
+    class_dir = os.path.join(data_dir, class_name)
     if not os.path.exists(class_dir):
         return 0
     # Zähle nur Bilddateien
@@ -52,6 +86,9 @@ classes = load_classes()
 
 def select_class_dialog(classes, current_class):
     """Zeigt ein Auswahlfenster mit Suchfunktion für Klassen"""
+    import tkinter as tk
+    from tkinter import ttk, messagebox, simpledialog
+
     selected_class = [current_class]  # Mutable container für Rückgabewert
     classes_modified = [False]  # Flag ob Klassen geändert wurden
     
@@ -115,9 +152,11 @@ def select_class_dialog(classes, current_class):
         
         if result:
             # Ordner löschen
-            class_dir = os.path.join(base_dir, class_to_delete)
-            if os.path.exists(class_dir):
-                shutil.rmtree(class_dir)
+            for data_dir in (base_dir, roi_dir):
+                class_dir = os.path.join(data_dir, class_to_delete)
+                if os.path.exists(class_dir):
+                    import shutil
+                    shutil.rmtree(class_dir)
             
             # Klasse aus Liste entfernen
             classes.remove(class_to_delete)
@@ -194,23 +233,55 @@ current_class_idx = 0
 count = get_image_count(classes[current_class_idx])  # Initiale Bildanzahl aus Ordner
 auto_mode = False
 frame_counter = 0
+first_frame = True
+startup_failed = False
+roi_detector = roi.RoiDetector() if roi else None
+use_roi = USE_ROI and roi is not None
+save_dir = base_dir
 
 print(f"STEUERUNG:")
 print(f"  [LEER] -> Einzelbild | [A] -> Auto-Modus AN/AUS")
+print(f"  [R]    -> ROI AN/AUS | [B] -> Hintergrund neu lernen")
 print(f"  [K]    -> Klasse auswählen | [Q] -> Beenden")
 
 while True:
-    ret, frame = cap.read()
+    with profiling.span('read'):
+        ret, frame = cap.read()
     if not ret: break
+    if first_frame:
+        first_frame = False
+        if not profiling.check_startup('collector', _start_time):
+            startup_failed = True  # Strict-Modus: sauber beenden
+            break
 
     current_class = classes[current_class_idx]
     frame_counter += 1
 
+    # Bauteil finden: gespeichert wird nur der Ausschnitt.
+    # Die leere Klasse speichert ganze Frames, der Hintergrund lernt aber weiter mit.
+    box = None
+    if use_roi:
+        with profiling.span('roi'):
+            box = roi_detector.detect(frame)
+    roi_active = use_roi and current_class.lower() != EMPTY_CLASS
+    save_img = roi_detector.crop(frame, box) if roi_active and box is not None else frame
+
+    # Ausschnitte und ganze Frames nie im selben Ordner mischen
+    new_save_dir = roi_dir if roi_active else base_dir
+    if new_save_dir != save_dir:
+        save_dir = new_save_dir
+        count = get_image_count(current_class, save_dir)
+    can_save = not roi_active or box is not None  # Mit ROI nur speichern wenn Teil erkannt
+
     # Logik für Auto-Modus: Alle 5 Frames ein Bild speichern
-    if auto_mode and frame_counter % 5 == 0:
+    if auto_mode and frame_counter % 5 == 0 and can_save:
         img_name = f"{current_class}_auto_{time.time()}.jpg"
-        cv2.imwrite(os.path.join(base_dir, current_class, img_name), frame)
-        count = get_image_count(current_class)  # Aktualisiere Zähler
+        os.makedirs(os.path.join(save_dir, current_class), exist_ok=True)
+        with profiling.span('imwrite'):
+            cv2.imwrite(os.path.join(save_dir, current_class, img_name), save_img)
+        profiling.count('bilder_gespeichert')
+        with profiling.span('image_count'):
+            count = get_image_count(current_class, save_dir)  # Aktualisiere Zähler
 
     # Visuelles Feedback im Fenster
     display_frame = frame.copy()
@@ -219,15 +290,31 @@ while True:
     
     cv2.putText(display_frame, f"KLASSE: {current_class}", (10, 30), 2, 0.8, (255, 255, 255), 2)
     cv2.putText(display_frame, f"MODUS: {status} | Bilder: {count}", (10, 60), 2, 0.8, color, 2)
-    cv2.imshow('Data Collector Pro', display_frame)
-
-    key = cv2.waitKey(1) & 0xFF
+    if roi_active:
+        if box is not None:
+            x, y, w, h = box
+            cv2.rectangle(display_frame, (x, y), (x + w, y + h), (255, 255, 0), 2)
+        roi_status = "ROI: Teil erkannt" if box is not None else (
+            "ROI: kein Teil erkannt" if roi_detector.ready else "ROI: lerne Hintergrund...")
+        cv2.putText(display_frame, roi_status, (10, 90), 2, 0.8, (255, 255, 0), 2)
+    with profiling.span('imshow'):
+        cv2.imshow('Data Collector Pro', display_frame)
+        key = cv2.waitKey(1) & 0xFF
     
-    if key == ord(' '): # Einzelbild
-        cv2.imwrite(os.path.join(base_dir, current_class, f"{current_class}_{time.time()}.jpg"), frame)
-        count = get_image_count(current_class)  # Aktualisiere Zähler
+    if key == ord(' ') and not can_save: # Einzelbild ohne erkanntes Teil
+        print("Kein Teil erkannt - Bild nicht gespeichert")
+    elif key == ord(' '): # Einzelbild
+        os.makedirs(os.path.join(save_dir, current_class), exist_ok=True)
+        with profiling.span('imwrite'):
+            cv2.imwrite(os.path.join(save_dir, current_class, f"{current_class}_{time.time()}.jpg"), save_img)
+        profiling.count('bilder_gespeichert')
+        count = get_image_count(current_class, save_dir)  # Aktualisiere Zähler
     elif key == ord('a'): # Auto-Modus togglen
         auto_mode = not auto_mode
+    elif key == ord('r'): # ROI togglen
+        use_roi = not use_roi and roi is not None
+    elif key == ord('b') and roi_detector: # Hintergrund neu lernen (Teil vorher entfernen!)
+        roi_detector.reset()
     elif key == ord('k'): # Klasse über Dialog auswählen
         auto_mode = False  # Auto-Modus zur Sicherheit aus
         selected, modified = select_class_dialog(classes, current_class)
@@ -235,9 +322,12 @@ while True:
             classes = load_classes()  # Aktualisierte Klassen neu laden
         if selected and selected in classes:
             current_class_idx = classes.index(selected)
-            count = get_image_count(classes[current_class_idx])  # Aktualisiere Zähler für neue Klasse
+            save_dir = None  # Zähler für neue Klasse im nächsten Frame aktualisieren
     elif key == ord('q'):
         break
 
 cap.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+cv2.destroyAllWindows()
+profiling.finish()
+if startup_failed:
+    sys.exit(1)
\ No newline at end of file
@@ -0,0 +1,19 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Bauen mit: pyinstaller collector_pro.spec (im Ordner 1_sammeln)
+# Die gemeinsamen Module liegen im Hauptordner und werden explizit eingebunden.
+
+a = Analysis(
+    ['collector_pro.py'],
+    pathex=['..'],
+    hiddenimports=['profiling', 'roi'],
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    name='collector_pro',
+    console=True,
+)
@@ -1,5 +1,6 @@
 import tensorflow as tf
 import os
+import sys
 
 # 1. PARAMETER
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -11,6 +12,12 @@ BATCH_SIZE = 16
 EPOCHS = 30
 FINE_TUNE_EPOCHS = 15
 
+# Gemeinsames Profiling-Modul liegt im Hauptordner
+sys.path.insert(0, os.path.dirname(script_dir))
+import profiling
+profiling.setup('train_ohne_nichts', script_dir)
+callbacks = profiling.tensorboard_callbacks(os.path.join(script_dir, 'logs', 'train_ohne_nichts'))
+
 # 2. DATEN LADEN - NUR DIE TEILE (ohne "nichts")
 # Erstelle Liste der Klassen ohne "nichts"
 class_names_to_include = ['137096', '31021', '37783']
@@ -75,7 +82,8 @@ model.compile(optimizer='adam',
               metrics=['accuracy'])
 
 print("\nStarte Training OHNE 'nichts' Klasse (Phase 1)...")
-history = model.fit(train_ds, validation_data=val_ds, epochs=EPOCHS)
+with profiling.span('fit_phase1'):
+    history = model.fit(train_ds, validation_data=val_ds, epochs=EPOCHS, callbacks=callbacks)
 
 # PHASE 2: FINE-TUNING
 print("\nStarte Fine-Tuning (Phase 2)...")
@@ -87,12 +95,14 @@ model.compile(optimizer=tf.keras.optimizers.Adam(1e-5),
               loss='sparse_categorical_crossentropy',
               metrics=['accuracy'])
 
-history_fine = model.fit(train_ds, validation_data=val_ds, epochs=FINE_TUNE_EPOCHS)
+with profiling.span('fit_phase2'):
+    history_fine = model.fit(train_ds, validation_data=val_ds, epochs=FINE_TUNE_EPOCHS, callbacks=callbacks)
 
 # 6. EXPORT NACH TFLITE
 print("\nKonvertiere zu TFLite...")
-converter = tf.lite.TFLiteConverter.from_keras_model(model)
-tflite_model = converter.convert()
+with profiling.span('tflite_convert'):
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    tflite_model = converter.convert()
 
 with open(OUTPUT_MODEL, 'wb') as f:
     f.write(tflite_model)
@@ -106,3 +116,5 @@ print(f"\nFertig! Dateien erstellt:")
 print(f"  - Modell: {OUTPUT_MODEL}")
 print(f"  - Labels: {OUTPUT_LABELS}")
 print(f"  - Klassen: {', '.join(class_names_to_include)}")
+
+profiling.finish()
\ No newline at end of file
@@ -1,9 +1,10 @@
 import tensorflow as tf
 import os
+import sys
 
 # 1. PARAMETER
 script_dir = os.path.dirname(os.path.abspath(__file__))
-DATA_DIR = os.path.join(script_dir, 'trainingsdaten')
+DATA_DIR = os.path.join(script_dir, 'trainingsdaten')  # Für ein Modell auf Ausschnitten: 'trainingsdaten_roi'
 OUTPUT_MODEL = os.path.join(script_dir, 'mein_modell.tflite')
 OUTPUT_LABELS = os.path.join(script_dir, 'labels.txt')
 IMG_SIZE = (224, 224)
@@ -11,6 +12,12 @@ BATCH_SIZE = 16  # Kleinere Batch-Size für besseres Lernen
 EPOCHS = 30  # Mehr Epochen für bessere Genauigkeit
 FINE_TUNE_EPOCHS = 15  # Zusätzliche Epochen für Fine-Tuning
 
+# Gemeinsames Profiling-Modul liegt im Hauptordner
+sys.path.insert(0, os.path.dirname(script_dir))
+import profiling
+profiling.setup('train', script_dir)
+callbacks = profiling.tensorboard_callbacks(os.path.join(script_dir, 'logs', 'train'))
+
 # Prüfen ob Trainingsdaten vorhanden sind
 if not os.path.exists(DATA_DIR):
     print(f"FEHLER: Ordner '{DATA_DIR}' nicht gefunden!")
@@ -68,7 +75,8 @@ model.compile(optimizer='adam',
               metrics=['accuracy'])
 
 print("Starte Training (Phase 1: Basis-Training)...")
-history = model.fit(train_ds, validation_data=val_ds, epochs=EPOCHS)
+with profiling.span('fit_phase1'):
+    history = model.fit(train_ds, validation_data=val_ds, epochs=EPOCHS, callbacks=callbacks)
 
 # PHASE 2: FINE-TUNING (Entfriere die letzten Layer des Base Models)
 print("\nStarte Fine-Tuning (Phase 2)...")
@@ -82,12 +90,14 @@ model.compile(optimizer=tf.keras.optimizers.Adam(1e-5),
               loss='sparse_categorical_crossentropy',
               metrics=['accuracy'])
 
-history_fine = model.fit(train_ds, validation_data=val_ds, epochs=FINE_TUNE_EPOCHS)
+with profiling.span('fit_phase2'):
+    history_fine = model.fit(train_ds, validation_data=val_ds, epochs=FINE_TUNE_EPOCHS, callbacks=callbacks)
 
 # 6. EXPORT NACH TFLITE
 print("Konvertiere zu TFLite...")
-converter = tf.lite.TFLiteConverter.from_keras_model(model)
-tflite_model = converter.convert()
+with profiling.span('tflite_convert'):
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    tflite_model = converter.convert()
 
 # Modell speichern
 with open(OUTPUT_MODEL, 'wb') as f:
@@ -101,4 +111,5 @@ with open(OUTPUT_LABELS, 'w', encoding='utf-8') as f:
 print(f"Fertig! Dateien erstellt:")
 print(f"  - Modell: {OUTPUT_MODEL}")
 print(f"  - Labels: {OUTPUT_LABELS}")
-print(f"  - Klassen: {', '.join(train_ds.class_names)}")
\ No newline at end of file
+print(f"  - Klassen: {', '.join(train_ds.class_names)}")
+profiling.finish()
\ No newline at end of file
@@ -1,12 +1,45 @@
+import time
+_start_time = time.perf_counter()  # Für Startzeit-Budget
+
 import cv2
 import numpy as np
-import tensorflow as tf
 import os
+import sys
+
+
+def load_interpreter_class():
+    """Lädt den schlanksten verfügbaren TFLite-Interpreter"""
+    # 1. LiteRT (Nachfolger von tflite_runtime)
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter, 'ai_edge_litert'
+    except ImportError:
+        pass
+    # 2. Standalone tflite_runtime
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter, 'tflite_runtime'
+    except ImportError:
+        pass
+    # 3. Fallback: komplettes TensorFlow (langsamer Start, viel RAM)
+    import tensorflow as tf
+    return tf.lite.Interpreter, 'tensorflow'
 
 # Pfade basierend auf Script-Ordner
 script_dir = os.path.dirname(os.path.abspath(__file__))
 model_path = os.path.join(script_dir, "mein_modell.tflite")
 labels_path = os.path.join(script_dir, "labels.txt")
+# Leere Frames erkennen und keine Inferenz ausführen (unabhängig vom Modell)
+SKIP_EMPTY = True
+# Bauteil ausschneiden statt ganzen Frame klassifizieren.
+# Aus, solange das Modell auf ganzen Frames trainiert ist (sonst neu trainieren!)
+CROP_ROI = False
+
+# Gemeinsames Profiling-Modul liegt im Hauptordner
+sys.path.insert(0, os.path.dirname(script_dir))
+import profiling
+import roi
+profiling.setup('tester', script_dir)
 
 # Überprüfung ob Dateien vorhanden sind
 if not os.path.exists(model_path):
@@ -20,8 +53,11 @@ if not os.path.exists(labels_path):
     exit()
 
 # 1. MODELL LADEN
-interpreter = tf.lite.Interpreter(model_path=model_path)
-interpreter.allocate_tensors()
+with profiling.span('load_model'):
+    Interpreter, backend = load_interpreter_class()
+    interpreter = Interpreter(model_path=model_path)
+    interpreter.allocate_tensors()
+print(f"Interpreter: {backend}")
 
 # Details über Input und Output abfragen
 input_details = interpreter.get_input_details()
@@ -37,47 +73,94 @@ print()
 
 cap = cv2.VideoCapture(1)
 
+roi_detector = roi.RoiDetector()
+skip_empty = SKIP_EMPTY
+crop_roi = CROP_ROI
+
 print("Starte Live-Erkennung... Drücke 'Q' zum Beenden.")
+print("  [E] -> Leere Frames überspringen AN/AUS | [R] -> Ausschnitt AN/AUS")
+print("  [B] -> Hintergrund neu lernen")
+print("  HINWEIS: Ausschnitt nur mit einem auf Ausschnitten trainierten Modell nutzen!")
+first_frame = True
+startup_failed = False
 
 while True:
-    ret, frame = cap.read()
+    with profiling.span('read'):
+        ret, frame = cap.read()
     if not ret: break
+    if first_frame:
+        first_frame = False
+        if not profiling.check_startup('tester', _start_time, backend):
+            startup_failed = True  # Strict-Modus: sauber beenden
+            break
+
+    # 2. BAUTEIL FINDEN (ROI)
+    box = None
+    roi_img = frame
+    if skip_empty or crop_roi:
+        with profiling.span('roi'):
+            box = roi_detector.detect(frame)
+    if crop_roi and box is not None:
+        roi_img = roi_detector.crop(frame, box)
+
+    if skip_empty and box is None:
+        # Leere Szene: entspricht der NICHTS-Klasse, Inferenz sparen
+        status = "Kein Teil im Bild" if roi_detector.ready else "Lerne Hintergrund..."
+        cv2.putText(frame, status, (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (200, 200, 200), 2)
+        profiling.count('leere_frames')
+    else:
+        # 3. BILD VORBEREITEN (Preprocessing)
+        # Genau wie im Training: Größe ändern und Normalisierung
+        with profiling.span('preprocess'):
+            img = cv2.resize(roi_img, (224, 224))
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)  # WICHTIG: OpenCV nutzt BGR, TensorFlow RGB!
+            img = img.astype(np.float32)
+            img = (img / 127.5) - 1.0  # MobileNetV2 Skalierung: von [0,255] zu [-1,1]
+            img = np.expand_dims(img, axis=0) # Batch-Dimension hinzufügen
+
+        # 4. INFERENZ (Vorhersage)
+        with profiling.span('invoke'):
+            interpreter.set_tensor(input_details[0]['index'], img)
+            interpreter.invoke()
+            output_data = interpreter.get_tensor(output_details[0]['index'])
+        profiling.count('inferenzen')
+
+        # Ergebnis auswerten
+        prediction_idx = np.argmax(output_data[0])
+        confidence = output_data[0][prediction_idx]
+        label = classes[prediction_idx]
+
+        # 5. ANZEIGE (erst nach der Inferenz ins Bild zeichnen)
+        if box is not None:
+            x, y, w, h = box
+            cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 255, 0), 2)
+        color = (0, 255, 0) if confidence > 0.7 else (0, 165, 255) # Grün wenn sicher
+        text = f"{label} ({confidence*100:.1f}%)"
+
+        cv2.putText(frame, text, (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+
+        # Zeige alle Wahrscheinlichkeiten für Debugging
+        y_offset = 100
+        for i, class_name in enumerate(classes):
+            prob_text = f"{class_name}: {output_data[0][i]*100:.1f}%"
+            cv2.putText(frame, prob_text, (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+            y_offset += 30
+
+    with profiling.span('imshow'):
+        cv2.imshow('TFLite Live Test', frame)
+        key = cv2.waitKey(1) & 0xFF
 
-    # 2. BILD VORBEREITEN (Preprocessing)
-    # Genau wie im Training: Größe ändern und Normalisierung
-    img = cv2.resize(frame, (224, 224))
-    img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)  # WICHTIG: OpenCV nutzt BGR, TensorFlow RGB!
-    img = img.astype(np.float32)
-    img = (img / 127.5) - 1.0  # MobileNetV2 Skalierung: von [0,255] zu [-1,1]
-    img = np.expand_dims(img, axis=0) # Batch-Dimension hinzufügen
-
-    # 3. INFERENZ (Vorhersage)
-    interpreter.set_tensor(input_details[0]['index'], img)
-    interpreter.invoke()
-    output_data = interpreter.get_tensor(output_details[0]['index'])
-    
-    # Ergebnis auswerten
-    prediction_idx = np.argmax(output_data[0])
-    confidence = output_data[0][prediction_idx]
-    label = classes[prediction_idx]
-
-    # 4. ANZEIGE
-    color = (0, 255, 0) if confidence > 0.7 else (0, 165, 255) # Grün wenn sicher
-    text = f"{label} ({confidence*100:.1f}%)"
-    
-    cv2.putText(frame, text, (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
-    
-    # Zeige alle Wahrscheinlichkeiten für Debugging
-    y_offset = 100
-    for i, class_name in enumerate(classes):
-        prob_text = f"{class_name}: {output_data[0][i]*100:.1f}%"
-        cv2.putText(frame, prob_text, (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
-        y_offset += 30
-    
-    cv2.imshow('TFLite Live Test', frame)
-
-    if cv2.waitKey(1) & 0xFF == ord('q'):
+    if key == ord('e'):
+        skip_empty = not skip_empty
+    elif key == ord('r'):
+        crop_roi = not crop_roi
+    elif key == ord('b'):
+        roi_detector.reset()
+    elif key == ord('q'):
         break
 
 cap.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+cv2.destroyAllWindows()
+profiling.finish()
+if startup_failed:
+    sys.exit(1)
\ No newline at end of file
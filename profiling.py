@@ -0,0 +1,198 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+# --- KONFIGURATION ---
+# Aktivieren über Umgebungsvariable (TRAINER_PROFILE=1) oder Flag (--profile)
+ENV_VAR = 'TRAINER_PROFILE'
+ENV_OUT = 'TRAINER_PROFILE_OUT'  # Optional: Pfad für die Trace-Datei
+CLI_FLAG = '--profile'
+STARTUP_BUDGET_VAR = 'TRAINER_STARTUP_BUDGET'  # Sekunden bis zum ersten Frame
+STARTUP_STRICT_VAR = 'TRAINER_STARTUP_STRICT'  # 1 = Abbruch bei Überschreitung
+DEFAULT_STARTUP_BUDGET = 5.0
+TENSORFLOW_STARTUP_BUDGET = 15.0  # Fallback ohne LiteRT (z.B. Windows) lädt ganz TF
+MAX_EVENTS = 100000  # Ringpuffer: nur die letzten Events landen im Trace
+MAX_SAMPLES = 10000  # Ringpuffer je Histogramm
+# ---------------------
+
+enabled = False
+_trace_path = None
+_events = deque(maxlen=MAX_EVENTS)
+_dropped = 0
+_counters = {}
+_histograms = {}
+_t0 = time.perf_counter()
+_NULL_SPAN = nullcontext()  # Wiederverwendbar -> kein Overhead wenn aus
+
+
+def setup(name, out_dir):
+    """Aktiviert das Profiling falls per Env-Var oder Flag gewünscht"""
+    global enabled, _trace_path
+    if CLI_FLAG in sys.argv:
+        sys.argv.remove(CLI_FLAG)
+        enabled = True
+    elif os.environ.get(ENV_VAR, '') not in ('', '0'):
+        enabled = True
+
+    if enabled:
+        _trace_path = os.environ.get(ENV_OUT) or os.path.join(out_dir, f"trace_{name}.json")
+        atexit.register(finish)
+        print(f"Profiling aktiv -> {_trace_path}")
+    return enabled
+
+
+def _record(event):
+    """Speichert ein Trace-Event, älteste fallen bei vollem Puffer heraus"""
+    global _dropped
+    if len(_events) == MAX_EVENTS:
+        _dropped += 1
+    _events.append(event)
+
+
+def _sample(name, value):
+    samples = _histograms.get(name)
+    if samples is None:
+        samples = _histograms[name] = deque(maxlen=MAX_SAMPLES)
+    samples.append(value)
+
+
+def _now_us():
+    return (time.perf_counter() - _t0) * 1e6
+
+
+class _Span:
+    """Misst die Dauer eines Abschnitts (Chrome-Trace 'X'-Event)"""
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, *exc):
+        end = _now_us()
+        _record({
+            'name': self.name,
+            'ph': 'X',
+            'ts': self.start,
+            'dur': end - self.start,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        })
+        _sample(self.name, (end - self.start) / 1000.0)
+        return False
+
+
+def span(name):
+    """Kontextmanager für einen benannten Zeitabschnitt"""
+    if not enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def count(name, n=1):
+    """Erhöht einen Zähler (Chrome-Trace 'C'-Event)"""
+    if not enabled:
+        return
+    value = _counters.get(name, 0) + n
+    _counters[name] = value
+    _record({
+        'name': name,
+        'ph': 'C',
+        'ts': _now_us(),
+        'pid': os.getpid(),
+        'args': {name: value},
+    })
+
+
+def observe(name, value):
+    """Fügt einen Messwert zu einem Histogramm hinzu"""
+    if not enabled:
+        return
+    _sample(name, value)
+
+
+def _summarize(values):
+    values = sorted(values)
+    n = len(values)
+    return {
+        'count': n,
+        'min': values[0],
+        'mean': sum(values) / n,
+        'p50': values[n // 2],
+        'p95': values[min(n - 1, int(n * 0.95))],
+        'max': values[-1],
+    }
+
+
+def summary():
+    """Liefert Zähler und Histogramm-Statistiken als Dict"""
+    return {
+        'counters': dict(_counters),
+        'histograms': {k: _summarize(v) for k, v in _histograms.items() if v},
+    }
+
+
+def finish():
+    """Schreibt den Trace (Chrome-Trace-Format) und gibt eine Übersicht aus"""
+    global _trace_path
+    if not enabled or _trace_path is None:
+        return
+    path, _trace_path = _trace_path, None  # Nur einmal schreiben (auch via atexit)
+
+    stats = summary()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'traceEvents': list(_events),
+            'displayTimeUnit': 'ms',
+            'otherData': stats,
+        }, f)
+
+    print(f"\nProfiling-Übersicht (Zeiten in ms):")
+    for name, s in stats['histograms'].items():
+        print(f"  {name:<20} n={s['count']:<6} mean={s['mean']:8.2f} "
+              f"p50={s['p50']:8.2f} p95={s['p95']:8.2f} max={s['max']:8.2f}")
+    for name, value in stats['counters'].items():
+        print(f"  {name:<20} {value}")
+    if _dropped:
+        print(f"  ({_dropped} ältere Events verworfen, Limit MAX_EVENTS={MAX_EVENTS})")
+    print(f"Trace gespeichert: {path} (öffnen mit chrome://tracing oder ui.perfetto.dev)")
+
+
+def check_startup(name, start_time, backend=None):
+    """Prüft die Zeit bis zum ersten Frame gegen das Budget.
+
+    Gibt False zurück, wenn im Strict-Modus abgebrochen werden soll -
+    der Aufrufer gibt dann Kamera und Fenster frei und beendet sich.
+    """
+    elapsed = time.perf_counter() - start_time
+    default = TENSORFLOW_STARTUP_BUDGET if backend == 'tensorflow' else DEFAULT_STARTUP_BUDGET
+    try:
+        budget = float(os.environ.get(STARTUP_BUDGET_VAR, default))
+    except ValueError:
+        print(f"WARNUNG: Ungültiger Wert für {STARTUP_BUDGET_VAR}, nutze {default}s")
+        budget = default
+    observe('startup', elapsed * 1000.0)
+    info = f" [{backend}]" if backend else ""
+
+    if elapsed <= budget:
+        print(f"Startzeit {name}{info}: {elapsed:.2f}s (Budget {budget:.1f}s)")
+        return True
+
+    print(f"WARNUNG: Startzeit {name}{info} {elapsed:.2f}s überschreitet Budget von {budget:.1f}s!")
+    return os.environ.get(STARTUP_STRICT_VAR, '') in ('', '0')
+
+
+def tensorboard_callbacks(log_dir, profile_batch=(10, 20)):
+    """TensorBoard-Callback mit Profiler für model.fit (leer wenn aus)"""
+    if not enabled:
+        return []
+    import tensorflow as tf
+    return [tf.keras.callbacks.TensorBoard(log_dir=log_dir, profile_batch=profile_batch)]
@@ -0,0 +1,105 @@
+import cv2
+
+# --- KONFIGURATION ---
+DETECT_WIDTH = 320  # Breite des verkleinerten Frames für die Erkennung
+MIN_AREA_RATIO = 0.002  # Mindestfläche einer Kontur (Anteil am Frame)
+MAX_AREA_RATIO = 0.5  # Mehr Vordergrund = Licht-/Kameraänderung, kein Bauteil
+MERGE_MARGIN = 0.1  # Konturen so nah an der größten gehören zum selben Teil (Anteil der Breite)
+PADDING = 0.15  # Rand um die Bounding Box (Anteil der Kantenlänge)
+WARMUP_FRAMES = 30  # Frames zum Lernen des Hintergrunds
+LEARNING_RATE = 0.005  # Hintergrund-Anpassung wenn kein Teil im Bild
+OBJECT_LEARNING_RATE = 0.0005  # Langsam weiterlernen, damit statische Störungen verblassen
+# ---------------------
+
+
+class RoiDetector:
+    """Findet das Bauteil per Hintergrundsubtraktion und schneidet es aus"""
+
+    def __init__(self, detect_width=DETECT_WIDTH, min_area_ratio=MIN_AREA_RATIO,
+                 max_area_ratio=MAX_AREA_RATIO, merge_margin=MERGE_MARGIN,
+                 padding=PADDING, warmup_frames=WARMUP_FRAMES):
+        self.detect_width = detect_width
+        self.min_area_ratio = min_area_ratio
+        self.max_area_ratio = max_area_ratio
+        self.merge_margin = merge_margin
+        self.padding = padding
+        self.warmup_frames = warmup_frames
+        self.frames_seen = 0
+        self.object_present = False
+        self.subtractor = cv2.createBackgroundSubtractorMOG2(detectShadows=True)
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+
+    @property
+    def ready(self):
+        """True sobald der Hintergrund gelernt wurde"""
+        return self.frames_seen >= self.warmup_frames
+
+    def reset(self):
+        """Hintergrund neu lernen (z.B. nach Kamera- oder Lichtänderung)"""
+        self.frames_seen = 0
+        self.object_present = False
+        self.subtractor = cv2.createBackgroundSubtractorMOG2(detectShadows=True)
+
+    def detect(self, frame):
+        """Liefert (x, y, w, h) des Bauteils im Originalframe oder None"""
+        h, w = frame.shape[:2]
+        scale = self.detect_width / w
+        small = cv2.resize(frame, (self.detect_width, max(1, int(h * scale))),
+                           interpolation=cv2.INTER_AREA)
+        small = cv2.GaussianBlur(small, (5, 5), 0)
+
+        # Während der Aufwärmphase voll lernen, danach langsamer solange ein Teil im Bild ist
+        if not self.ready:
+            rate = -1
+        else:
+            rate = OBJECT_LEARNING_RATE if self.object_present else LEARNING_RATE
+        mask = self.subtractor.apply(small, learningRate=rate)
+        self.frames_seen += 1
+        if not self.ready:
+            return None
+
+        # Schatten (127) verwerfen, Rauschen entfernen
+        _, mask = cv2.threshold(mask, 200, 255, cv2.THRESH_BINARY)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.kernel)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self.kernel, iterations=2)
+
+        # Fast alles Vordergrund -> globale Änderung statt Bauteil.
+        # Kein Teil melden, damit sich der Hintergrund wieder anpassen kann.
+        frame_area = mask.shape[0] * mask.shape[1]
+        if cv2.countNonZero(mask) > self.max_area_ratio * frame_area:
+            self.object_present = False
+            return None
+
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        min_area = self.min_area_ratio * frame_area
+        contours = [c for c in contours if cv2.contourArea(c) >= min_area]
+        self.object_present = bool(contours)
+        if not contours:
+            return None
+
+        # Größte Kontur ist das Teil; nur Konturen in ihrer Nähe dazunehmen,
+        # damit ein Störfleck woanders die Box nicht aufbläht
+        largest = max(contours, key=cv2.contourArea)
+        lx, ly, lw, lh = cv2.boundingRect(largest)
+        margin = self.merge_margin * mask.shape[1]
+        x0, y0, x1, y1 = lx, ly, lx + lw, ly + lh
+        for c in contours:
+            bx, by, bw, bh = cv2.boundingRect(c)
+            if (bx <= lx + lw + margin and bx + bw >= lx - margin and
+                    by <= ly + lh + margin and by + bh >= ly - margin):
+                x0, y0 = min(x0, bx), min(y0, by)
+                x1, y1 = max(x1, bx + bw), max(y1, by + bh)
+        return (int(x0 / scale), int(y0 / scale),
+                int((x1 - x0) / scale), int((y1 - y0) / scale))
+
+    def crop(self, frame, box):
+        """Schneidet einen quadratischen Bereich mit Rand um die Box aus (Kopie)"""
+        fh, fw = frame.shape[:2]
+        x, y, w, h = box
+        side = int(max(w, h) * (1 + 2 * self.padding))
+        side = min(side, fw, fh)  # Quadrat muss ins Bild passen
+        cx, cy = x + w // 2, y + h // 2
+        x0 = min(max(cx - side // 2, 0), fw - side)
+        y0 = min(max(cy - side // 2, 0), fh - side)
+        # Kopie, damit spätere Overlays im Frame nicht im Ausschnitt landen
+        return frame[y0:y0 + side, x0:x0 + side].copy()